@@ -26,6 +26,7 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
 from sklearn.metrics import classification_report, confusion_matrix, balanced_accuracy_score
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.neighbors import BallTree
 from sklearn.svm import SVC
 from sklearn.neural_network import MLPClassifier
 
@@ -74,8 +75,18 @@ class EnhancedBiosignatureAnalyzer:
         }
 
         self.models = {}  # se llenará con {name: {..., 'model': pipeline}}
+        self.best_model_name = None
         self.labeling_strategy = labeling_strategy  # 'thresholds' | 'quantiles'
 
+        # Explicaciones (solo Top-K): caché {(modelo, hash_fila): (features, clases, contrib)}
+        self.explanation_top_k = 20
+        self.explanation_cache = {}
+        self.explainer_tables = {}  # {modelo: tablas de caminos precalculadas por árbol}
+
+        # Catálogo cargado + índice espacial (ra/dec) para consultas por región
+        self.catalog_df = None
+        self.sky_index = None
+
     # -------------------- UTILIDADES BÁSICAS --------------------
 
     def ensure_data_directory(self):
@@ -193,6 +204,101 @@ class EnhancedBiosignatureAnalyzer:
         r_outer = np.sqrt(L_star / S_outer)
         return r_inner, r_outer
 
+    # -------------------- ÍNDICE ESPACIAL (CIELO) --------------------
+
+    @staticmethod
+    def _radec_to_unit_vectors(ra_deg, dec_deg):
+        """Convierte ra/dec (grados) a vectores unitarios (n, 3)."""
+        ra = np.radians(np.asarray(ra_deg, dtype=float))
+        dec = np.radians(np.asarray(dec_deg, dtype=float))
+        cos_dec = np.cos(dec)
+        return np.column_stack([cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)])
+
+    def build_sky_index(self, df: pd.DataFrame):
+        """
+        Construye un BallTree sobre vectores unitarios (ra/dec) del catálogo.
+        Las filas sin coordenadas quedan fuera del índice. Las posiciones devueltas
+        por las consultas son posicionales (iloc) sobre `df`.
+        """
+        if 'ra' not in df.columns or 'dec' not in df.columns:
+            print("   ⚠️  Catálogo sin columnas ra/dec: índice espacial no disponible")
+            self.sky_index = None
+            return None
+
+        ra = pd.to_numeric(df['ra'], errors='coerce').to_numpy(dtype=float)
+        dec = pd.to_numeric(df['dec'], errors='coerce').to_numpy(dtype=float)
+        valid = ~(np.isnan(ra) | np.isnan(dec))
+        rows = np.flatnonzero(valid)
+        if rows.size == 0:
+            print("   ⚠️  Sin coordenadas válidas: índice espacial no disponible")
+            self.sky_index = None
+            return None
+
+        ra, dec = ra[rows] % 360.0, dec[rows]
+        dec_order = np.argsort(dec, kind='stable')
+        self.sky_index = {
+            'tree': BallTree(self._radec_to_unit_vectors(ra, dec)),
+            'rows': rows,
+            'ra': ra,
+            'dec': dec,
+            # Orden por declinación para consultas de caja (búsqueda binaria)
+            'dec_order': dec_order,
+            'dec_sorted': dec[dec_order],
+        }
+        print(f"   🧭 Índice espacial: {rows.size:,} objetos con ra/dec")
+        return self.sky_index
+
+    def cone_search(self, ra: float, dec: float, radius_deg: float):
+        """
+        Devuelve posiciones (iloc) del catálogo dentro de un cono de radio
+        `radius_deg` centrado en (ra, dec). Distancia angular exacta vía cuerda.
+        """
+        if self.sky_index is None:
+            return np.array([], dtype=int)
+
+        radius = float(np.clip(radius_deg, 0.0, 180.0))
+        chord = 2.0 * np.sin(np.radians(radius) / 2.0)
+        center = self._radec_to_unit_vectors([ra], [dec])
+        hits = self.sky_index['tree'].query_radius(center, r=chord)[0]
+        return np.sort(self.sky_index['rows'][hits])
+
+    def region_search(self, ra_range, dec_range):
+        """
+        Devuelve posiciones (iloc) dentro de una caja ra/dec (grados).
+        Si ra_min > ra_max la caja cruza ra=0 (p. ej. (350, 10)); un rango de
+        360° o más (p. ej. (0, 360)) cubre toda la ascensión recta.
+        """
+        if self.sky_index is None:
+            return np.array([], dtype=int)
+
+        ra_min, ra_max = float(ra_range[0]), float(ra_range[1])
+        full_ra = (ra_max - ra_min) >= 360.0
+        ra_width = (ra_max - ra_min) % 360.0  # ancho hacia el este desde ra_min
+        ra_min %= 360.0
+        dec_min, dec_max = float(min(dec_range)), float(max(dec_range))
+
+        # Banda de declinación por búsqueda binaria; luego filtro en ra
+        lo = np.searchsorted(self.sky_index['dec_sorted'], dec_min, side='left')
+        hi = np.searchsorted(self.sky_index['dec_sorted'], dec_max, side='right')
+        band = self.sky_index['dec_order'][lo:hi]
+        if full_ra:
+            return np.sort(self.sky_index['rows'][band])
+        ra = self.sky_index['ra'][band]
+        mask = ((ra - ra_min) % 360.0) <= ra_width
+        return np.sort(self.sky_index['rows'][band[mask]])
+
+    def select_sky_region(self, region: dict):
+        """
+        region:
+          - cono: {'ra': .., 'dec': .., 'radius_deg': ..}
+          - caja: {'ra_range': (min, max), 'dec_range': (min, max)}
+        """
+        if 'radius_deg' in region:
+            return self.cone_search(region['ra'], region['dec'], region['radius_deg'])
+        if 'ra_range' in region and 'dec_range' in region:
+            return self.region_search(region['ra_range'], region['dec_range'])
+        raise ValueError(f"Región no soportada: {region}")
+
     # -------------------- SCORING ALGORÍTMICO --------------------
 
     def calculate_enhanced_score(self, planet_data):
@@ -489,6 +595,9 @@ class EnhancedBiosignatureAnalyzer:
         # Selección por balanced accuracy de CV
         best_model_name = max(results, key=lambda k: results[k]['cv_mean_balanced_accuracy'])
         self.models = results
+        self.best_model_name = best_model_name
+        self.explanation_cache = {}  # modelos nuevos → contribuciones obsoletas
+        self.explainer_tables = {}
 
         # Guardado de modelos (pipelines completos)
         for name, res in results.items():
@@ -510,31 +619,182 @@ class EnhancedBiosignatureAnalyzer:
         probabilities = model.predict_proba(X)  # todos los definidos soportan probas
         return predictions, probabilities
 
-    # -------------------- PIPELINE COMPLETO --------------------
+    # -------------------- EXPLICACIÓN TOP-K --------------------
 
-    def analyze_all_planets(self, use_dataset: str = 'confirmed'):
+    @staticmethod
+    def _tree_node_values(tree, normalize: bool):
         """
-        Pipeline completo de análisis:
-          - Descarga datos
-          - Scoring algorítmico
-          - Features y etiquetas
-          - Entrena y predice con ML
-          - Guarda CSV, modelos y reporte
+        Valores por nodo (n_nodos, n_outputs) coherentes con las hojas:
+          - clasificador (normalize): conteos (ponderados) → probabilidades
+          - boosting: GB reemplaza solo las hojas (paso de Newton); los nodos
+            internos se recalculan como media ponderada de sus hijos.
         """
-        print("🌍 ANALIZADOR MEJORADO DE BIOSIGNATURAS")
-        print("=" * 60)
+        t = tree.tree_
+        values = t.value[:, 0, :].astype(float)
+        if normalize:
+            return values / values.sum(axis=1, keepdims=True)
+
+        weights = t.weighted_n_node_samples
+        # Los hijos siempre tienen id mayor que el padre: recorrido inverso = de abajo arriba
+        for node in np.flatnonzero(t.children_left != -1)[::-1]:
+            left, right = t.children_left[node], t.children_right[node]
+            values[node] = (weights[left] * values[left] + weights[right] * values[right]) / (
+                weights[left] + weights[right]
+            )
+        return values
 
-        # Descargar datos
-        datasets = self.download_nasa_datasets()
-        if use_dataset not in datasets or datasets[use_dataset].empty:
-            print("❌ No se pudieron descargar datos válidos.")
-            return None, None
+    @classmethod
+    def _tree_path_table(cls, tree, normalize: bool):
+        """
+        Tabla de caminos (Saabas) de un árbol: para cada nodo, la feature que
+        divide a su padre (-1 en la raíz) y el cambio de valor respecto al padre.
+        Devuelve (edge_feature, deltas, root).
+        """
+        t = tree.tree_
+        values = cls._tree_node_values(tree, normalize)
+
+        internal = np.flatnonzero(t.children_left != -1)
+        parent = np.full(t.node_count, -1)
+        parent[t.children_left[internal]] = internal
+        parent[t.children_right[internal]] = internal
+        children = np.flatnonzero(parent >= 0)
+
+        edge_feature = np.full(t.node_count, -1)
+        edge_feature[children] = t.feature[parent[children]]
+        deltas = np.zeros_like(values)
+        deltas[children] = values[children] - values[parent[children]]
+        return edge_feature, deltas, values[0]
+
+    def _build_explainer_tables(self, clf):
+        """
+        Precalcula las tablas de todos los árboles de un modelo entrenado (una
+        sola vez por modelo). RandomForest: probabilidad media por árbol;
+        GradientBoosting: log-odds por columna, escaladas por learning_rate.
+        """
+        trees = []
+        if isinstance(clf, RandomForestClassifier):
+            n_cols, scale = clf.n_classes_, 1.0 / len(clf.estimators_)
+            roots = np.zeros(n_cols)
+            for est in clf.estimators_:
+                edge_feature, deltas, root = self._tree_path_table(est, normalize=True)
+                trees.append((est, slice(None), edge_feature, deltas))
+                roots += root
+        else:
+            n_cols, scale = clf.estimators_.shape[1], clf.learning_rate
+            roots = np.zeros(n_cols)
+            for stage in clf.estimators_:
+                for k, est in enumerate(stage):
+                    edge_feature, deltas, root = self._tree_path_table(est, normalize=False)
+                    trees.append((est, k, edge_feature, deltas[:, 0]))
+                    roots[k] += root[0]
+        return {'trees': trees, 'n_cols': n_cols, 'scale': scale, 'roots': scale * roots}
+
+    def _model_contributions(self, tables: dict, Xt: np.ndarray):
+        """
+        Contribuciones (n, n_features, n_clases) recorriendo solo los caminos de
+        las filas de `Xt` en las tablas precalculadas: coste O(n · profundidad)
+        por árbol, independiente del tamaño del árbol.
+        """
+        total = np.zeros((Xt.shape[0], Xt.shape[1], tables['n_cols']))
+        for est, col, edge_feature, deltas in tables['trees']:
+            path = est.decision_path(Xt).tocoo()  # (fila, nodo) visitados
+            edges = edge_feature[path.col] >= 0  # la raíz no aporta
+            rows, nodes = path.row[edges], path.col[edges]
+            np.add.at(total, (rows, edge_feature[nodes], col), deltas[nodes])
+        total *= tables['scale']
+        if tables['n_cols'] == 1:  # GB binario: una sola columna hacia la clase positiva
+            total = np.concatenate([-total, total], axis=2)
+        return total
+
+    def _model_output_and_bias(self, clf, tables: dict, Xt: np.ndarray):
+        """
+        Salida del modelo en el espacio de las contribuciones (n, n_clases) y
+        valor raíz (n_clases,): probabilidad (RF) o log-odds (GB).
+        """
+        if isinstance(clf, RandomForestClassifier):
+            return clf.predict_proba(Xt), tables['roots']
+
+        decision = clf.decision_function(Xt).reshape(Xt.shape[0], -1)
+        # Predicción inicial (init_) = decisión − suma de hojas; raíz = init + suma de raíces
+        leaves = np.zeros(decision.shape[1])
+        for est, k, _, _ in tables['trees']:
+            leaves[k] += est.predict(Xt[:1])[0]
+        bias = (decision[0] - tables['scale'] * leaves) + tables['roots']
+        if decision.shape[1] == 1:
+            return np.hstack([-decision, decision]), np.concatenate([-bias, bias])
+        return decision, bias
+
+    def _explainer_model_name(self, model_name: str = None):
+        """Modelo a explicar: el pedido si es de árboles; si no, el primer RF/GB entrenado."""
+        candidates = [model_name, 'RandomForest', 'GradientBoosting']
+        for name in candidates:
+            if name in self.models:
+                clf = self.models[name]['model'][-1]
+                if isinstance(clf, (RandomForestClassifier, GradientBoostingClassifier)):
+                    return name
+        return None
+
+    def explain_top_k(self, results_df: pd.DataFrame, X: pd.DataFrame, model_name: str = None, k: int = None):
+        """
+        Contribuciones por feature solo para las Top-K filas de `results_df`
+        (índice posicional sobre `X`), hacia la clase que predice el modelo
+        explicador (puede diferir de `ml_class` si el mejor modelo no es RF/GB).
+        Usa caché por (modelo, hash de fila): coste acotado por K, no por tamaño
+        del catálogo. Añade `ml_explained_by`, `ml_explained_class`,
+        `ml_top_features` y `contrib_<feature>`.
+        """
+        k = self.explanation_top_k if k is None else k
+        explainer = self._explainer_model_name(model_name)
+        if explainer is None:
+            print("   ⚠️  Sin modelo de árboles entrenado: se omite la explicación Top-K")
+            return results_df
+
+        pipe = self.models[explainer]['model']
+        top = results_df.head(k)
+        X_top = X.iloc[top.index.to_numpy()]
+        row_hashes = pd.util.hash_pandas_object(X_top, index=False).to_numpy()
+
+        missing = [i for i, h in enumerate(row_hashes) if (explainer, h) not in self.explanation_cache]
+        if missing:
+            preprocess, clf = pipe[:-1], pipe[-1]
+            if explainer not in self.explainer_tables:
+                self.explainer_tables[explainer] = self._build_explainer_tables(clf)
+            tables = self.explainer_tables[explainer]
+            Xt = np.asarray(preprocess.transform(X_top.iloc[missing]), dtype=np.float32)
+            features = list(preprocess.get_feature_names_out())
+            contrib = self._model_contributions(tables, Xt)
+            # Control: raíz + contribuciones debe reproducir la salida del modelo
+            output, bias = self._model_output_and_bias(clf, tables, Xt)
+            if not np.allclose(bias + contrib.sum(axis=1), output, atol=1e-6):
+                print(f"   ⚠️  Contribuciones de {explainer} no aditivas (revisar explicación)")
+            predicted = clf.classes_[np.argmax(output, axis=1)]
+            for j, i in enumerate(missing):
+                self.explanation_cache[(explainer, row_hashes[i])] = (
+                    features, clf.classes_, contrib[j], predicted[j]
+                )
+        print(f"   🔍 Explicación Top-{len(top)} con {explainer} ({len(missing)} nuevas, {len(top) - len(missing)} en caché)")
+
+        results_df = results_df.copy()
+        results_df['ml_explained_by'] = None
+        results_df['ml_explained_class'] = None
+        results_df['ml_top_features'] = None
+        for label, h in zip(top.index, row_hashes):
+            features, classes, contrib, pred = self.explanation_cache[(explainer, h)]
+            values = contrib[:, np.flatnonzero(classes == pred)[0]]
+            for feat, val in zip(features, values):
+                results_df.loc[label, f'contrib_{feat}'] = float(val)
+            order = np.argsort(-np.abs(values))[:3]
+            results_df.loc[label, 'ml_explained_by'] = explainer
+            results_df.loc[label, 'ml_explained_class'] = self.ml_classes.get(int(pred), str(pred))
+            results_df.loc[label, 'ml_top_features'] = "; ".join(
+                f"{features[i]} ({values[i]:+.3f})" for i in order
+            )
+        return results_df
 
-        df = datasets[use_dataset].copy()
-        print(f"📊 Analizando {len(df):,} exoplanetas (source: {use_dataset})...")
+    # -------------------- SCORING POR LOTE --------------------
 
-        # Calcular scores algorítmicos
-        print("🔢 Calculando scores algorítmicos...")
+    def score_planets(self, df: pd.DataFrame):
+        """Scoring algorítmico fila a fila. Devuelve (scores, detailed_results)."""
         scores = []
         detailed_results = []
         for idx, row in df.iterrows():
@@ -553,10 +813,52 @@ class EnhancedBiosignatureAnalyzer:
                 'orbital_period': row.get('pl_orbper', np.nan),
                 'equilibrium_temp': row.get('pl_eqt', np.nan),
                 'stellar_temp': row.get('st_teff', np.nan),
-                'discovery_year': row.get('disc_year', np.nan)
+                'discovery_year': row.get('disc_year', np.nan),
+                'ra': row.get('ra', np.nan),
+                'dec': row.get('dec', np.nan)
             })
+        return np.asarray(scores, dtype=float), detailed_results
 
-        scores = np.asarray(scores, dtype=float)
+    def attach_ml_predictions(self, detailed_results, predictions, probabilities):
+        """Añade clase/confianza ML a cada resultado y devuelve el DataFrame ordenado."""
+        for i, result in enumerate(detailed_results):
+            pred = int(predictions[i])
+            conf = float(np.max(probabilities[i]))
+            result['ml_prediction'] = pred
+            result['ml_class'] = self.ml_classes.get(pred, str(pred))
+            result['ml_confidence'] = conf
+        return pd.DataFrame(detailed_results).sort_values('biosignature_score', ascending=False)
+
+    # -------------------- PIPELINE COMPLETO --------------------
+
+    def analyze_all_planets(self, use_dataset: str = 'confirmed'):
+        """
+        Pipeline completo de análisis:
+          - Descarga datos
+          - Scoring algorítmico
+          - Features y etiquetas
+          - Entrena y predice con ML
+          - Guarda CSV, modelos y reporte
+        """
+        print("🌍 ANALIZADOR MEJORADO DE BIOSIGNATURAS")
+        print("=" * 60)
+
+        # Descargar datos
+        datasets = self.download_nasa_datasets()
+        if use_dataset not in datasets or datasets[use_dataset].empty:
+            print("❌ No se pudieron descargar datos válidos.")
+            return None, None
+
+        df = datasets[use_dataset].copy()
+        print(f"📊 Analizando {len(df):,} exoplanetas (source: {use_dataset})...")
+
+        # Catálogo + índice espacial para rankings por región posteriores
+        self.catalog_df = df
+        self.build_sky_index(df)
+
+        # Calcular scores algorítmicos
+        print("🔢 Calculando scores algorítmicos...")
+        scores, detailed_results = self.score_planets(df)
 
         # Features y etiquetas
         print("🤖 Preparando datos para Machine Learning...")
@@ -573,15 +875,9 @@ class EnhancedBiosignatureAnalyzer:
             print("❌ No hay predicciones.")
             return None, ml_results
 
-        # Mezclar resultados
-        for i, result in enumerate(detailed_results):
-            pred = int(predictions[i])
-            conf = float(np.max(probabilities[i]))
-            result['ml_prediction'] = pred
-            result['ml_class'] = self.ml_classes.get(pred, str(pred))
-            result['ml_confidence'] = conf
-
-        results_df = pd.DataFrame(detailed_results).sort_values('biosignature_score', ascending=False)
+        # Mezclar resultados + explicación Top-K
+        results_df = self.attach_ml_predictions(detailed_results, predictions, probabilities)
+        results_df = self.explain_top_k(results_df, X, best_model)
 
         # Guardado
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -618,15 +914,57 @@ class EnhancedBiosignatureAnalyzer:
         print(f"   • Reporte: {os.path.join(self.data_dir, f'enhanced_report_{timestamp}.md')}")
         return results_df, ml_results
 
+    # -------------------- RANKING POR REGIÓN DEL CIELO --------------------
+
+    def rank_sky_region(self, region: dict, model_name: str = None):
+        """
+        Ranking limitado a una región del cielo (cono o caja ra/dec, ver
+        `select_sky_region`). Reutiliza el catálogo, el índice y los modelos de
+        `analyze_all_planets`: scoring, features y predicción solo sobre las
+        coincidencias. Guarda CSV y reporte con prefijo `region_`.
+        """
+        if self.catalog_df is None or self.sky_index is None:
+            print("❌ Sin catálogo indexado: ejecuta analyze_all_planets primero.")
+            return None
+
+        model_name = model_name or self.best_model_name
+        if model_name not in self.models:
+            print(f"❌ Modelo {model_name} no encontrado")
+            return None
+
+        positions = self.select_sky_region(region)
+        print(f"🧭 Región {region}: {len(positions):,} objetos")
+        if len(positions) == 0:
+            return pd.DataFrame()
+
+        df = self.catalog_df.iloc[positions]
+        _, detailed_results = self.score_planets(df)
+        X, _ = self.prepare_ml_features(df)
+        predictions, probabilities = self.predict_with_ml(X, model_name)
+        results_df = self.attach_ml_predictions(detailed_results, predictions, probabilities)
+        results_df = self.explain_top_k(results_df, X, model_name)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv_filename = os.path.join(self.data_dir, f"region_ranking_{timestamp}.csv")
+        results_df.to_csv(csv_filename, index=False)
+        self.generate_enhanced_report(results_df, self.models, timestamp, region=region)
+
+        print(f"   • CSV: {csv_filename}")
+        return results_df
+
     # -------------------- REPORTE --------------------
 
-    def generate_enhanced_report(self, df: pd.DataFrame, ml_results: dict, timestamp: str):
-        """Genera reporte Markdown con resultados y Top-20."""
-        report_filename = os.path.join(self.data_dir, f"enhanced_report_{timestamp}.md")
+    def generate_enhanced_report(self, df: pd.DataFrame, ml_results: dict, timestamp: str, region: dict = None):
+        """Genera reporte Markdown con resultados y Top-20 (opcionalmente limitado a una región)."""
+        prefix = "region_report" if region else "enhanced_report"
+        report_filename = os.path.join(self.data_dir, f"{prefix}_{timestamp}.md")
         with open(report_filename, 'w', encoding='utf-8') as f:
             f.write("# REPORTE MEJORADO DE BIOSIGNATURAS CON MACHINE LEARNING\n")
             f.write(f"**Fecha:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("**Sistema:** Enhanced Biosignature Analyzer v2.1\n\n")
+            f.write("**Sistema:** Enhanced Biosignature Analyzer v2.1\n")
+            if region:
+                f.write(f"**Región del cielo:** {region}\n")
+            f.write("\n")
 
             # Resumen ejecutivo
             f.write("## RESUMEN EJECUTIVO\n")
@@ -657,12 +995,28 @@ class EnhancedBiosignatureAnalyzer:
                     f"{row.detectability_score:.0f} |\n"
                 )
 
+            # Explicación Top-K (contribuciones por feature hacia la clase ML)
+            if 'ml_top_features' in df.columns:
+                explained = df[df['ml_top_features'].notna()].reset_index(drop=True)
+                if not explained.empty:
+                    f.write(f"\n## EXPLICACIÓN TOP {len(explained)} (CONTRIBUCIONES POR FEATURE)\n\n")
+                    f.write("Unidades: probabilidad (RandomForest) o log-odds (GradientBoosting). ")
+                    f.write("Las contribuciones van hacia la clase predicha por el modelo explicador.\n\n")
+                    f.write("| Rank | Planeta | ML Class | Modelo | Clase explicada | Principales contribuciones |\n")
+                    f.write("|------|---------|----------|--------|-----------------|----------------------------|\n")
+                    for rank, row in enumerate(explained.itertuples(index=False), 1):
+                        f.write(
+                            f"| {rank} | {str(row.planet_name)[:20]} | {row.ml_class} | "
+                            f"{row.ml_explained_by} | {row.ml_explained_class} | {row.ml_top_features} |\n"
+                        )
+
             # Metodología
             f.write("\n## METODOLOGÍA MEJORADA\n")
             f.write("1. **Scoring Algorítmico:** Reglas físicas y heurísticas conservadoras.\n")
             f.write("2. **Machine Learning:** Clasificación automática en 5 categorías.\n")
             f.write("3. **Validación Cruzada:** Pipelines con imputación y escalado sin fuga.\n")
             f.write("4. **Features Avanzadas:** 14+ características planetarias y estelares.\n")
+            f.write("5. **Explicación Top-K:** Contribuciones por camino de decisión (RF/GB) solo para los mejores candidatos.\n")
 
         print(f"📄 Reporte generado: {report_filename}")
 